@@ -2,19 +2,18 @@ from pyautocad import Autocad, APoint
 import math
 import pythoncom
 from typing import List, Dict, Any, Optional, Union
+from entity_registry import EntityRegistry
 
 
 METERS_TO_UNITS = 1000 
 
 
-entity_groups = {}
-current_group_id = 0
+# Shared by all tool calls; FastMCP may run them concurrently on worker threads
+entity_groups = EntityRegistry()
 
 def get_next_group_id() -> str:
     """Get next group ID for tracking entities"""
-    global current_group_id
-    current_group_id += 1
-    return f"group_{current_group_id}"
+    return entity_groups.next_id()
 
 def clear_all_entities() -> dict:
     """Clear all entities and reset group tracking"""
@@ -22,21 +21,19 @@ def clear_all_entities() -> dict:
         pythoncom.CoInitialize()
         acad = Autocad(create_if_not_exists=True)
         
-        model_space = acad.doc.ModelSpace
         count = 0
-        entities = [entity for entity in model_space]
-        
-        for entity in entities:
-            try:
-                entity.Delete()
-                count += 1
-            except Exception as e:
-                print(f"⚠ Couldn't delete entity: {e}")
-        
         
-        global entity_groups, current_group_id
-        entity_groups = {}
-        current_group_id = 0
+        # Wait for transforms in progress; groups are dropped once everything is deleted
+        with entity_groups.clearing():
+            model_space = acad.doc.ModelSpace
+            entities = [entity for entity in model_space]
+            
+            for entity in entities:
+                try:
+                    entity.Delete()
+                    count += 1
+                except Exception as e:
+                    print(f"⚠ Couldn't delete entity: {e}")
         
         
         try:
@@ -54,28 +51,32 @@ def clear_all_entities() -> dict:
 
 
 
+def _delete_entities(entities: list) -> int:
+    """Delete entities from the drawing; caller must hold the group's write lock"""
+    count = 0
+    for entity in entities:
+        try:
+            entity.Delete()
+            count += 1
+        except Exception as e:
+            print(f"Couldn't delete entity: {e}")
+    return count
+
 def delete_group(group_name: str) -> dict:
     """Delete all entities in a specific group"""
     try:
-        if group_name not in entity_groups:
-            return {
-                "success": False,
-                "message": f"Group '{group_name}' not found",
-                "available_groups": list(entity_groups.keys())
-            }
-        
-        count = 0
-        entities = entity_groups[group_name]
-        
-        for entity in entities:
-            try:
-                entity.Delete()
-                count += 1
-            except Exception as e:
-                print(f"Couldn't delete entity: {e}")
-        
-        # Remove group from tracking
-        del entity_groups[group_name]
+        with entity_groups.write(group_name) as entities:
+            if entities is None:
+                return {
+                    "success": False,
+                    "message": f"Group '{group_name}' not found",
+                    "available_groups": entity_groups.keys()
+                }
+            
+            count = _delete_entities(entities)
+            
+            # Remove group from tracking
+            entity_groups.unlink(group_name)
         
         return {
             "success": True,
@@ -115,19 +116,16 @@ def draw_rectangle_simple(x1: float, y1: float, x2: float, y2: float,
             (x1_u, y2_u), (x1_u, y1_u) 
         ]
         
-        for i in range(0, len(points), 2):
-            p1 = APoint(points[i][0], points[i][1])
-            p2 = APoint(points[i+1][0], points[i+1][1])
-            line = acad.model.AddLine(p1, p2)
-            lines.append(line)
-        
-        if not group_name:
-            group_name = get_next_group_id()
-        
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
+        with entity_groups.creating():
+            for i in range(0, len(points), 2):
+                p1 = APoint(points[i][0], points[i][1])
+                p2 = APoint(points[i+1][0], points[i+1][1])
+                line = acad.model.AddLine(p1, p2)
+                lines.append(line)
         
-        entity_groups[group_name].extend(lines)
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, *lines)
         
         return {
             "success": True,
@@ -148,16 +146,13 @@ def draw_circle_simple(x: float, y: float, radius: float, group_name: str = None
         
         center = APoint(x * METERS_TO_UNITS, y * METERS_TO_UNITS)
         radius_u = radius * METERS_TO_UNITS
-        circle = acad.model.AddCircle(center, radius_u)
-        
-        # Track in group
-        if not group_name:
-            group_name = get_next_group_id()
-        
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
+        with entity_groups.creating():
+            circle = acad.model.AddCircle(center, radius_u)
         
-        entity_groups[group_name].append(circle)
+            # Track in group
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, circle)
         
         return {
             "success": True,
@@ -179,16 +174,13 @@ def draw_line_simple(x1: float, y1: float, x2: float, y2: float,
         
         p1 = APoint(x1 * METERS_TO_UNITS, y1 * METERS_TO_UNITS)
         p2 = APoint(x2 * METERS_TO_UNITS, y2 * METERS_TO_UNITS)
-        line = acad.model.AddLine(p1, p2)
-        
-        
-        if not group_name:
-            group_name = get_next_group_id()
+        with entity_groups.creating():
+            line = acad.model.AddLine(p1, p2)
         
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
         
-        entity_groups[group_name].append(line)
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, line)
         
         return {
             "success": True,
@@ -217,16 +209,13 @@ def draw_line_by_angle(x: float, y: float, length_m: float, angle_deg: float,
         
         p1 = APoint(x1, y1)
         p2 = APoint(x2, y2)
-        line = acad.model.AddLine(p1, p2)
-        
-        # Track in group
-        if not group_name:
-            group_name = get_next_group_id()
-        
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
+        with entity_groups.creating():
+            line = acad.model.AddLine(p1, p2)
         
-        entity_groups[group_name].append(line)
+            # Track in group
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, line)
         
         return {
             "success": True,
@@ -256,22 +245,23 @@ def zoom_extents() -> dict:
 def move_group(group_name: str, dx: float, dy: float) -> dict:
     """Move all entities in a group"""
     try:
-        if group_name not in entity_groups:
-            return {
-                "success": False,
-                "message": f"Group '{group_name}' not found"
-            }
-        
         pythoncom.CoInitialize()
         move_vector = APoint(dx * METERS_TO_UNITS, dy * METERS_TO_UNITS)
         count = 0
         
-        for entity in entity_groups[group_name]:
-            try:
-                entity.Move(APoint(0, 0), move_vector)
-                count += 1
-            except Exception as e:
-                print(f"⚠ Couldn't move entity: {e}")
+        with entity_groups.write(group_name) as entities:
+            if entities is None:
+                return {
+                    "success": False,
+                    "message": f"Group '{group_name}' not found"
+                }
+            
+            for entity in entities:
+                try:
+                    entity.Move(APoint(0, 0), move_vector)
+                    count += 1
+                except Exception as e:
+                    print(f"⚠ Couldn't move entity: {e}")
         
         return {
             "success": True,
@@ -286,32 +276,33 @@ def move_group(group_name: str, dx: float, dy: float) -> dict:
 def copy_group(group_name: str, dx: float, dy: float, new_group_name: str = None) -> dict:
     """Copy all entities in a group to a new location"""
     try:
-        if group_name not in entity_groups:
-            return {
-                "success": False,
-                "message": f"Group '{group_name}' not found"
-            }
-        
         pythoncom.CoInitialize()
         copy_vector = APoint(dx * METERS_TO_UNITS, dy * METERS_TO_UNITS)
-        
-        if not new_group_name:
-            new_group_name = f"{group_name}_copy_{get_next_group_id()}"
-        
         new_entities = []
         count = 0
         
-        for entity in entity_groups[group_name]:
-            try:
-                copied = entity.Copy()
-                copied.Move(APoint(0, 0), copy_vector)
-                new_entities.append(copied)
-                count += 1
-            except Exception as e:
-                print(f"⚠ Couldn't copy entity: {e}")
-        
-        # Track new group
-        entity_groups[new_group_name] = new_entities
+        with entity_groups.creating():
+            with entity_groups.read(group_name) as entities:
+                if entities is None:
+                    return {
+                        "success": False,
+                        "message": f"Group '{group_name}' not found"
+                    }
+            
+                if not new_group_name:
+                    new_group_name = f"{group_name}_copy_{get_next_group_id()}"
+            
+                for entity in entities:
+                    try:
+                        copied = entity.Copy()
+                        copied.Move(APoint(0, 0), copy_vector)
+                        new_entities.append(copied)
+                        count += 1
+                    except Exception as e:
+                        print(f"⚠ Couldn't copy entity: {e}")
+        
+            # Track new group (after releasing the source lock, so two copies can't deadlock)
+            entity_groups.put(new_group_name, new_entities)
         
         return {
             "success": True,
@@ -328,23 +319,24 @@ def copy_group(group_name: str, dx: float, dy: float, new_group_name: str = None
 def rotate_group(group_name: str, base_x: float, base_y: float, angle_deg: float) -> dict:
     """Rotate all entities in a group around a base point"""
     try:
-        if group_name not in entity_groups:
-            return {
-                "success": False,
-                "message": f"Group '{group_name}' not found"
-            }
-        
         pythoncom.CoInitialize()
         base_point = APoint(base_x * METERS_TO_UNITS, base_y * METERS_TO_UNITS)
         angle_rad = math.radians(angle_deg)
         count = 0
         
-        for entity in entity_groups[group_name]:
-            try:
-                entity.Rotate(base_point, angle_rad)
-                count += 1
-            except Exception as e:
-                print(f"⚠ Couldn't rotate entity: {e}")
+        with entity_groups.write(group_name) as entities:
+            if entities is None:
+                return {
+                    "success": False,
+                    "message": f"Group '{group_name}' not found"
+                }
+            
+            for entity in entities:
+                try:
+                    entity.Rotate(base_point, angle_rad)
+                    count += 1
+                except Exception as e:
+                    print(f"⚠ Couldn't rotate entity: {e}")
         
         return {
             "success": True,
@@ -360,22 +352,23 @@ def rotate_group(group_name: str, base_x: float, base_y: float, angle_deg: float
 def scale_group(group_name: str, base_x: float, base_y: float, scale_factor: float) -> dict:
     """Scale all entities in a group from a base point"""
     try:
-        if group_name not in entity_groups:
-            return {
-                "success": False,
-                "message": f"Group '{group_name}' not found"
-            }
-        
         pythoncom.CoInitialize()
         base_point = APoint(base_x * METERS_TO_UNITS, base_y * METERS_TO_UNITS)
         count = 0
         
-        for entity in entity_groups[group_name]:
-            try:
-                entity.ScaleEntity(base_point, scale_factor)
-                count += 1
-            except Exception as e:
-                print(f"⚠ Couldn't scale entity: {e}")
+        with entity_groups.write(group_name) as entities:
+            if entities is None:
+                return {
+                    "success": False,
+                    "message": f"Group '{group_name}' not found"
+                }
+            
+            for entity in entities:
+                try:
+                    entity.ScaleEntity(base_point, scale_factor)
+                    count += 1
+                except Exception as e:
+                    print(f"⚠ Couldn't scale entity: {e}")
         
         return {
             "success": True,
@@ -392,34 +385,38 @@ def mirror_group(group_name: str, mirror_x1: float, mirror_y1: float,
                 mirror_x2: float, mirror_y2: float, keep_original: bool = True) -> dict:
     """Mirror all entities in a group across a line"""
     try:
-        if group_name not in entity_groups:
-            return {
-                "success": False,
-                "message": f"Group '{group_name}' not found"
-            }
-        
         pythoncom.CoInitialize()
         mirror_pt1 = APoint(mirror_x1 * METERS_TO_UNITS, mirror_y1 * METERS_TO_UNITS)
         mirror_pt2 = APoint(mirror_x2 * METERS_TO_UNITS, mirror_y2 * METERS_TO_UNITS)
-        
-        new_group_name = f"{group_name}_mirrored_{get_next_group_id()}"
         new_entities = []
         count = 0
         
-        for entity in entity_groups[group_name]:
-            try:
-                mirrored = entity.Mirror(mirror_pt1, mirror_pt2)
-                new_entities.append(mirrored)
-                count += 1
-            except Exception as e:
-                print(f"⚠ Couldn't mirror entity: {e}")
-        
-        # Track new group
-        entity_groups[new_group_name] = new_entities
-        
-        # Delete originals if requested
-        if not keep_original:
-            delete_group(group_name)
+        with entity_groups.creating():
+            # Removing the originals needs exclusive access; a plain mirror only reads
+            lock = entity_groups.read if keep_original else entity_groups.write
+            with lock(group_name) as entities:
+                if entities is None:
+                    return {
+                        "success": False,
+                        "message": f"Group '{group_name}' not found"
+                    }
+            
+                new_group_name = f"{group_name}_mirrored_{get_next_group_id()}"
+                for entity in entities:
+                    try:
+                        mirrored = entity.Mirror(mirror_pt1, mirror_pt2)
+                        new_entities.append(mirrored)
+                        count += 1
+                    except Exception as e:
+                        print(f"⚠ Couldn't mirror entity: {e}")
+            
+                # Delete originals if requested
+                if not keep_original:
+                    _delete_entities(entities)
+                    entity_groups.unlink(group_name)
+        
+            # Track new group
+            entity_groups.put(new_group_name, new_entities)
         
         return {
             "success": True,
@@ -434,18 +431,23 @@ def mirror_group(group_name: str, mirror_x1: float, mirror_y1: float,
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+def _normalize_points(points: List[Union[List[float], Dict[str, float]]]) -> List[List[float]]:
+    """Normalize [[x,y], ...] or [{"x": x, "y": y}, ...] to [[x,y], ...]"""
+    norm_points: List[List[float]] = []
+    for p in points:
+        if isinstance(p, dict):
+            norm_points.append([float(p.get("x")), float(p.get("y"))])
+        else:
+            norm_points.append([float(p[0]), float(p[1])])
+    return norm_points
+
 def draw_polyline(points: List[Union[List[float], Dict[str, float]]], closed: bool = False, group_name: str = None) -> dict:
     """Draw a polyline through multiple points.
 
     Accepts points either as [[x,y], ...] or as [{"x": x, "y": y}, ...] to better align with
     structured tool calling constraints (avoids nested array-of-array schema issues)."""
     try:
-        norm_points: List[List[float]] = []
-        for p in points:
-            if isinstance(p, dict):
-                norm_points.append([float(p.get("x")), float(p.get("y"))])
-            else:
-                norm_points.append([float(p[0]), float(p[1])])
+        norm_points = _normalize_points(points)
         if len(norm_points) < 2:
             return {"success": False, "error": "Need at least 2 points for polyline"}
 
@@ -459,14 +461,13 @@ def draw_polyline(points: List[Union[List[float], Dict[str, float]]], closed: bo
         if closed:
             autocad_points.extend([norm_points[0][0] * METERS_TO_UNITS, norm_points[0][1] * METERS_TO_UNITS])
 
-        polyline = acad.model.AddLightWeightPolyline(autocad_points)
-        polyline.Closed = closed
+        with entity_groups.creating():
+            polyline = acad.model.AddLightWeightPolyline(autocad_points)
+            polyline.Closed = closed
 
-        if not group_name:
-            group_name = get_next_group_id()
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
-        entity_groups[group_name].append(polyline)
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, polyline)
 
         return {
             "success": True,
@@ -491,16 +492,13 @@ def draw_arc(center_x: float, center_y: float, radius: float,
         start_angle_rad = math.radians(start_angle_deg)
         end_angle_rad = math.radians(end_angle_deg)
         
-        arc = acad.model.AddArc(center, radius_u, start_angle_rad, end_angle_rad)
-        
-        # Track in group
-        if not group_name:
-            group_name = get_next_group_id()
-        
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
+        with entity_groups.creating():
+            arc = acad.model.AddArc(center, radius_u, start_angle_rad, end_angle_rad)
         
-        entity_groups[group_name].append(arc)
+            # Track in group
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, arc)
         
         return {
             "success": True,
@@ -526,17 +524,14 @@ def draw_text(x: float, y: float, text: str, height: float = 0.2,
         height_u = height * METERS_TO_UNITS
         angle_rad = math.radians(angle_deg)
         
-        text_obj = acad.model.AddText(text, insertion_point, height_u)
-        text_obj.Rotation = angle_rad
+        with entity_groups.creating():
+            text_obj = acad.model.AddText(text, insertion_point, height_u)
+            text_obj.Rotation = angle_rad
         
-        # Track in group
-        if not group_name:
-            group_name = get_next_group_id()
-        
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
-        
-        entity_groups[group_name].append(text_obj)
+            # Track in group
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, text_obj)
         
         return {
             "success": True,
@@ -562,16 +557,13 @@ def draw_dimension_linear(x1: float, y1: float, x2: float, y2: float,
         pt2 = APoint(x2 * METERS_TO_UNITS, y2 * METERS_TO_UNITS)
         dim_line_pt = APoint((x1 + x2) / 2 * METERS_TO_UNITS, dim_line_y * METERS_TO_UNITS)
         
-        dimension = acad.model.AddDimAligned(pt1, pt2, dim_line_pt)
-        
-        # Track in group
-        if not group_name:
-            group_name = get_next_group_id()
-        
-        if group_name not in entity_groups:
-            entity_groups[group_name] = []
+        with entity_groups.creating():
+            dimension = acad.model.AddDimAligned(pt1, pt2, dim_line_pt)
         
-        entity_groups[group_name].append(dimension)
+            # Track in group
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, dimension)
         
         return {
             "success": True,
@@ -649,6 +641,251 @@ def get_drawing_extents() -> dict:
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+def _add_entities_bulk(acad, polylines: List[tuple] = (), texts: List[tuple] = (),
+                       dimensions: List[tuple] = (), lines: List[tuple] = ()) -> list:
+    """Create many entities in one pass, wrapped in a single undo mark.
+
+    All or nothing: if any entity can't be created, the ones already created are deleted
+    and the error is re-raised, so no untracked entities are left in the drawing.
+
+    lines: (x1, y1, x2, y2) in meters
+    polylines: (flat [x1, y1, x2, y2, ...] in meters, closed)
+    texts: (text, x, y, height) in meters
+    dimensions: (x1, y1, x2, y2, dim_line_y) in meters"""
+    created = []
+    doc = acad.doc
+    model = acad.model
+    doc.StartUndoMark()
+    try:
+        for x1, y1, x2, y2 in lines:
+            created.append(model.AddLine(APoint(x1 * METERS_TO_UNITS, y1 * METERS_TO_UNITS),
+                                         APoint(x2 * METERS_TO_UNITS, y2 * METERS_TO_UNITS)))
+        for flat_points, closed in polylines:
+            polyline = model.AddLightWeightPolyline([v * METERS_TO_UNITS for v in flat_points])
+            created.append(polyline)
+            polyline.Closed = closed
+        for text, x, y, height in texts:
+            created.append(model.AddText(text, APoint(x * METERS_TO_UNITS, y * METERS_TO_UNITS),
+                                         height * METERS_TO_UNITS))
+        for x1, y1, x2, y2, dim_line_y in dimensions:
+            created.append(model.AddDimAligned(
+                APoint(x1 * METERS_TO_UNITS, y1 * METERS_TO_UNITS),
+                APoint(x2 * METERS_TO_UNITS, y2 * METERS_TO_UNITS),
+                APoint((x1 + x2) / 2 * METERS_TO_UNITS, dim_line_y * METERS_TO_UNITS)))
+    except Exception:
+        _delete_entities(created)
+        raise
+    finally:
+        doc.EndUndoMark()
+    return created
+
+def _serpentine(fixed: List[float], start: float, end: float, vertical: bool) -> List[float]:
+    """Flat point list visiting parallel lines at each `fixed` coordinate, alternating direction"""
+    flat = []
+    for i, f in enumerate(fixed):
+        a, b = (start, end) if i % 2 == 0 else (end, start)
+        flat.extend([f, a, f, b] if vertical else [a, f, b, f])
+    return flat
+
+def _grid_polylines(xs: List[float], ys: List[float]) -> List[tuple]:
+    """Grid lines at the given x and y positions as two serpentine polylines.
+
+    The connecting runs lie on the outer border, so the result looks like separate lines."""
+    return [
+        (_serpentine(xs, ys[0], ys[-1], vertical=True), False),
+        (_serpentine(ys, xs[0], xs[-1], vertical=False), False),
+    ]
+
+def draw_grid(x: float, y: float, cols: int, rows: int, spacing_x: float, spacing_y: float,
+              group_name: str = None) -> dict:
+    """Draw a grid of cols x rows cells starting at the lower-left corner (x, y)"""
+    try:
+        if cols < 1 or rows < 1:
+            return {"success": False, "error": "Need at least 1 column and 1 row"}
+        if spacing_x <= 0 or spacing_y <= 0:
+            return {"success": False, "error": "Spacing must be positive"}
+
+        pythoncom.CoInitialize()
+        acad = Autocad(create_if_not_exists=True)
+
+        xs = [x + i * spacing_x for i in range(cols + 1)]
+        ys = [y + j * spacing_y for j in range(rows + 1)]
+        with entity_groups.creating():
+            entities = _add_entities_bulk(acad, polylines=_grid_polylines(xs, ys))
+
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, *entities)
+
+        return {
+            "success": True,
+            "message": "Grid drawn",
+            "group_name": group_name,
+            "corners_m": [[xs[0], ys[0]], [xs[-1], ys[-1]]],
+            "lines_count": len(xs) + len(ys),
+            "entity_count": len(entities)
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def draw_column_array(x: float, y: float, cols: int, rows: int, spacing_x: float, spacing_y: float,
+                      width: float, depth: float, group_name: str = None) -> dict:
+    """Draw rectangular columns of width x depth centred on a cols x rows grid starting at (x, y)"""
+    try:
+        if cols < 1 or rows < 1:
+            return {"success": False, "error": "Need at least 1 column and 1 row"}
+        if spacing_x <= 0 or spacing_y <= 0:
+            return {"success": False, "error": "Spacing must be positive"}
+        if width <= 0 or depth <= 0:
+            return {"success": False, "error": "Column width and depth must be positive"}
+        if (cols > 1 and width >= spacing_x) or (rows > 1 and depth >= spacing_y):
+            return {"success": False, "error": "Columns would overlap; spacing must exceed width and depth"}
+
+        pythoncom.CoInitialize()
+        acad = Autocad(create_if_not_exists=True)
+
+        hw = width / 2
+        hd = depth / 2
+        polylines = []
+        for j in range(rows):
+            cy = y + j * spacing_y
+            for i in range(cols):
+                cx = x + i * spacing_x
+                polylines.append(([cx - hw, cy - hd, cx + hw, cy - hd,
+                                   cx + hw, cy + hd, cx - hw, cy + hd], True))
+        with entity_groups.creating():
+            entities = _add_entities_bulk(acad, polylines=polylines)
+
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, *entities)
+
+        return {
+            "success": True,
+            "message": "Column array drawn",
+            "group_name": group_name,
+            "columns_count": len(entities),
+            "size_m": [width, depth]
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def draw_dimension_chain(points: List[Union[List[float], Dict[str, float]]], dim_line_y: float,
+                         group_name: str = None) -> dict:
+    """Draw a chain of linear dimensions between consecutive points.
+
+    Points are given like draw_polyline: [[x,y], ...] or [{"x": x, "y": y}, ...]."""
+    try:
+        norm_points = _normalize_points(points)
+        if len(norm_points) < 2:
+            return {"success": False, "error": "Need at least 2 points for a dimension chain"}
+
+        pythoncom.CoInitialize()
+        acad = Autocad(create_if_not_exists=True)
+
+        dimensions = [(p1[0], p1[1], p2[0], p2[1], dim_line_y)
+                      for p1, p2 in zip(norm_points, norm_points[1:])]
+        with entity_groups.creating():
+            entities = _add_entities_bulk(acad, dimensions=dimensions)
+
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, *entities)
+
+        return {
+            "success": True,
+            "message": "Dimension chain drawn",
+            "group_name": group_name,
+            "points_m": norm_points,
+            "dim_line_y_m": dim_line_y,
+            "dimensions_count": len(entities)
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def draw_table(x: float, y: float, cells: List[Union[List[str], str]], col_width: float,
+               row_height: float, text_height: float = 0.2, group_name: str = None) -> dict:
+    """Draw a table with text cells, (x, y) being the top-left corner.
+
+    cells holds one entry per row: a list of cell strings or a single string with cells
+    separated by "|"."""
+    try:
+        table = [row.split("|") if isinstance(row, str) else [str(c) for c in row] for row in cells]
+        n_rows = len(table)
+        n_cols = max((len(row) for row in table), default=0)
+        if n_rows < 1 or n_cols < 1:
+            return {"success": False, "error": "Need at least 1 row and 1 column"}
+        if col_width <= 0 or row_height <= 0:
+            return {"success": False, "error": "Column width and row height must be positive"}
+        if text_height <= 0 or text_height > row_height:
+            return {"success": False, "error": "Text height must be positive and fit in the row height"}
+
+        pythoncom.CoInitialize()
+        acad = Autocad(create_if_not_exists=True)
+
+        xs = [x + i * col_width for i in range(n_cols + 1)]
+        ys = [y - j * row_height for j in range(n_rows + 1)]
+        pad = (row_height - text_height) / 2
+        texts = [(text.strip(), x + c * col_width + pad, y - (r + 1) * row_height + pad, text_height)
+                 for r, row in enumerate(table)
+                 for c, text in enumerate(row) if text.strip()]
+        with entity_groups.creating():
+            entities = _add_entities_bulk(acad, polylines=_grid_polylines(xs, ys), texts=texts)
+
+            if not group_name:
+                group_name = get_next_group_id()
+            entity_groups.add(group_name, *entities)
+
+        return {
+            "success": True,
+            "message": "Table drawn",
+            "group_name": group_name,
+            "top_left_m": [x, y],
+            "rows": n_rows,
+            "columns": n_cols,
+            "text_count": len(texts)
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+def draw_batch(calls: List[Dict[str, Any]], group_name: str) -> dict:
+    """Draw a run of draw_line_simple, draw_rectangle_simple and draw_dimension_linear calls
+    into one group through the bulk path. Used by session replay.
+
+    Each call is {"tool": name, "args": {...}} with the arguments of that tool."""
+    try:
+        lines = []
+        dimensions = []
+        for call in calls:
+            tool = call["tool"]
+            a = call["args"]
+            if tool == "draw_line_simple":
+                lines.append((a["x1"], a["y1"], a["x2"], a["y2"]))
+            elif tool == "draw_rectangle_simple":
+                x1, y1, x2, y2 = a["x1"], a["y1"], a["x2"], a["y2"]
+                lines.extend([(x1, y1, x2, y1), (x2, y1, x2, y2),
+                              (x2, y2, x1, y2), (x1, y2, x1, y1)])
+            elif tool == "draw_dimension_linear":
+                dimensions.append((a["x1"], a["y1"], a["x2"], a["y2"], a["dim_line_y"]))
+            else:
+                return {"success": False, "error": f"Tool '{tool}' can't be batched"}
+
+        pythoncom.CoInitialize()
+        acad = Autocad(create_if_not_exists=True)
+
+        with entity_groups.creating():
+            entities = _add_entities_bulk(acad, lines=lines, dimensions=dimensions)
+            entity_groups.add(group_name, *entities)
+
+        return {
+            "success": True,
+            "message": f"Batch of {len(calls)} calls drawn",
+            "group_name": group_name,
+            "entity_count": len(entities)
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
 # Legacy functions for backward compatibility
 def draw_rectangle(x1: float, y1: float, x2: float, y2: float) -> dict:
     """Legacy function - use draw_rectangle_simple instead"""
@@ -698,4 +935,4 @@ def move_all(dx: float, dy: float) -> dict:
         return {"success": False, "error": str(e)}
     
 
-tools = [move_all,erase_selected_by_shape,erase_all,draw_circle,draw_rectangle,get_drawing_extents,set_layer,draw_dimension_linear,draw_text,draw_arc,draw_polyline,mirror_group,scale_group,rotate_group,get_next_group_id,clear_all_entities,delete_group,list_groups,draw_rectangle_simple,draw_circle_simple,draw_line_simple,draw_line_by_angle,zoom_extents,move_group,copy_group]
\ No newline at end of file
+tools = [move_all,erase_selected_by_shape,erase_all,draw_circle,draw_rectangle,get_drawing_extents,set_layer,draw_dimension_linear,draw_text,draw_arc,draw_polyline,mirror_group,scale_group,rotate_group,get_next_group_id,clear_all_entities,delete_group,list_groups,draw_rectangle_simple,draw_circle_simple,draw_line_simple,draw_line_by_angle,zoom_extents,move_group,copy_group,draw_grid,draw_column_array,draw_dimension_chain,draw_table]
\ No newline at end of file
@@ -0,0 +1,128 @@
+import sys
+import threading
+import types
+
+import pytest
+
+
+class FakeEntity:
+    """Stand-in for an AutoCAD COM entity"""
+
+    def __init__(self, doc, kind, *args):
+        self.doc = doc
+        self.kind = kind
+        self.args = args
+        self.moves = []
+
+    def Move(self, p1, p2):
+        self.moves.append((p1, p2))
+
+    def Rotate(self, base_point, angle):
+        pass
+
+    def ScaleEntity(self, base_point, factor):
+        pass
+
+    def Copy(self):
+        return self.doc.add(self.kind, *self.args)
+
+    def Mirror(self, p1, p2):
+        return self.doc.add(self.kind, *self.args)
+
+    def Delete(self):
+        self.doc.remove(self)
+
+
+class FakeModel:
+    def __init__(self, doc):
+        self.doc = doc
+
+    def AddLine(self, *args):
+        return self.doc.add("line", *args)
+
+    def AddCircle(self, *args):
+        return self.doc.add("circle", *args)
+
+    def AddArc(self, *args):
+        return self.doc.add("arc", *args)
+
+    def AddLightWeightPolyline(self, points):
+        return self.doc.add("polyline", list(points))
+
+    def AddText(self, *args):
+        return self.doc.add("text", *args)
+
+    def AddDimAligned(self, *args):
+        return self.doc.add("dimension", *args)
+
+
+class FakeLayers:
+    def __init__(self):
+        self.layers = {}
+
+    def Item(self, name):
+        return self.layers[name]
+
+    def Add(self, name):
+        layer = self.layers[name] = types.SimpleNamespace(name=name, color=7)
+        return layer
+
+
+class FakeDoc:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.entities = []
+        self.Layers = FakeLayers()
+        self.ActiveLayer = None
+
+    @property
+    def ModelSpace(self):
+        with self._lock:
+            return list(self.entities)
+
+    def add(self, kind, *args):
+        entity = FakeEntity(self, kind, *args)
+        with self._lock:
+            self.entities.append(entity)
+        return entity
+
+    def remove(self, entity):
+        with self._lock:
+            self.entities.remove(entity)
+
+    def SendCommand(self, command):
+        pass
+
+    def StartUndoMark(self):
+        pass
+
+    def EndUndoMark(self):
+        pass
+
+
+fake_doc = FakeDoc()
+
+
+class FakeAutocad:
+    def __init__(self, create_if_not_exists=False):
+        self.doc = fake_doc
+        self.model = FakeModel(fake_doc)
+
+
+# Tests always run against the fake backend, never a live AutoCAD
+sys.modules["pyautocad"] = types.SimpleNamespace(
+    Autocad=FakeAutocad, APoint=lambda x, y, z=0: (x, y, z))
+sys.modules["pythoncom"] = types.SimpleNamespace(CoInitialize=lambda: None)
+
+
+@pytest.fixture
+def drawing(monkeypatch):
+    """Empty fake drawing and a fresh group registry"""
+    import autocad_tools
+    from entity_registry import EntityRegistry
+    fake_doc.reset()
+    monkeypatch.setattr(autocad_tools, "entity_groups", EntityRegistry())
+    return fake_doc
@@ -0,0 +1,194 @@
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+
+class _RWLock:
+    """Reader/writer lock. Waiting writers block new readers so transforms are not starved."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self) -> None:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+
+class _Group:
+    __slots__ = ("entities", "lock", "removed", "seq")
+
+    def __init__(self, seq: int):
+        self.entities: List[Any] = []
+        self.lock = _RWLock()
+        self.removed = False
+        self.seq = seq
+
+
+class EntityRegistry:
+    """Thread-safe mapping of group name -> list of AutoCAD entities.
+
+    Group lookup goes through sharded dicts so unrelated groups don't contend on one
+    lock. Each group has its own reader/writer lock: operations on different groups run
+    in parallel, writes to the same group are serialized. Group IDs are allocated
+    atomically and never reused, so a draw that allocated an ID before a reset can't
+    share it with a draw after the reset.
+
+    Code that creates entities holds creating() until they are registered; clearing()
+    waits for it, so a clear can't delete an entity between its creation and its group."""
+
+    def __init__(self, shards: int = 16):
+        self._shards = [({}, threading.Lock()) for _ in range(shards)]
+        self._id_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+        self._gate = _RWLock()
+
+    def _shard(self, name: str):
+        return self._shards[hash(name) % len(self._shards)]
+
+    def next_id(self) -> str:
+        """Allocate a unique group ID"""
+        with self._id_lock:
+            return f"group_{next(self._ids)}"
+
+    def _lookup(self, name: str, create: bool) -> Optional[_Group]:
+        groups, lock = self._shard(name)
+        with lock:
+            group = groups.get(name)
+            if group is None and create:
+                with self._id_lock:
+                    seq = next(self._seq)
+                group = groups[name] = _Group(seq)
+            return group
+
+    @contextmanager
+    def read(self, name: str) -> Iterator[Optional[List[Any]]]:
+        """Hold the group's read lock; yields its entity list, or None if the group doesn't exist"""
+        while True:
+            group = self._lookup(name, create=False)
+            if group is None:
+                yield None
+                return
+            group.lock.acquire_read()
+            if not group.removed:
+                break
+            group.lock.release_read()
+        try:
+            yield group.entities
+        finally:
+            group.lock.release_read()
+
+    @contextmanager
+    def write(self, name: str, create: bool = False) -> Iterator[Optional[List[Any]]]:
+        """Hold the group's write lock; yields its entity list, or None if the group doesn't exist.
+
+        With create=True a missing group is created, so the yielded list is never None."""
+        while True:
+            group = self._lookup(name, create=create)
+            if group is None:
+                yield None
+                return
+            group.lock.acquire_write()
+            if not group.removed:
+                break
+            # Removed while we were waiting; look it up again
+            group.lock.release_write()
+        try:
+            yield group.entities
+        finally:
+            group.lock.release_write()
+
+    def add(self, name: str, *entities: Any) -> None:
+        """Append entities to a group, creating it if needed"""
+        with self.write(name, create=True) as group:
+            group.extend(entities)
+
+    def put(self, name: str, entities: List[Any]) -> None:
+        """Replace a group's entities, creating it if needed"""
+        with self.write(name, create=True) as group:
+            group[:] = entities
+
+    def unlink(self, name: str) -> None:
+        """Drop a group from the registry. Caller must hold its write lock."""
+        groups, lock = self._shard(name)
+        with lock:
+            group = groups.pop(name, None)
+            if group is not None:
+                group.removed = True
+
+    def reset(self) -> None:
+        """Forget all groups. ID allocation continues where it was."""
+        for groups, lock in self._shards:
+            with lock:
+                for group in groups.values():
+                    group.removed = True
+                groups.clear()
+
+    @contextmanager
+    def creating(self) -> Iterator[None]:
+        """Hold while creating entities and registering them; any number may run at once"""
+        self._gate.acquire_read()
+        try:
+            yield
+        finally:
+            self._gate.release_read()
+
+    @contextmanager
+    def clearing(self) -> Iterator[None]:
+        """Wait for entity creation to finish and hold the write lock of every group,
+        then forget all groups on a clean exit"""
+        self._gate.acquire_write()
+        acquired = []
+        try:
+            held = sorted(self._groups(), key=lambda item: item[1].seq)
+            for _, group in held:
+                group.lock.acquire_write()
+                acquired.append(group)
+            yield
+            self.reset()
+        finally:
+            for group in acquired:
+                group.lock.release_write()
+            self._gate.release_write()
+
+    def _groups(self) -> List[tuple]:
+        items = []
+        for groups, lock in self._shards:
+            with lock:
+                items.extend(groups.items())
+        return items
+
+    def keys(self) -> List[str]:
+        """Group names in creation order"""
+        return [name for name, _ in sorted(self._groups(), key=lambda item: item[1].seq)]
+
+    def __contains__(self, name: str) -> bool:
+        return self._lookup(name, create=False) is not None
+
+    def __len__(self) -> int:
+        return len(self.keys())
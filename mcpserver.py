@@ -1,10 +1,17 @@
 from fastmcp import FastMCP
 import inspect
+import os
+import time
 import autocad_tools
+from session_log import SessionRecorder
 mcp = FastMCP("autocad_mcp_server")
+recorder = SessionRecorder(os.environ.get(
+    "AUTOCAD_MCP_SESSION_LOG",
+    os.path.join("sessions", time.strftime("%Y%m%d-%H%M%S") + ".mcplog"),
+))
 for func in autocad_tools.tools:
     if callable(func):
-        mcp.tool()(func)
+        mcp.tool()(recorder.wrap(func))
 if __name__ == "__main__":
     mcp.run(
         transport="http",
@@ -0,0 +1,330 @@
+import msgpack
+import functools
+import inspect
+import itertools
+import os
+import struct
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# Tools that change neither the drawing nor the group tracking state. Every other
+# tool is recorded.
+READ_ONLY_TOOLS = {"list_groups", "get_drawing_extents", "zoom_extents", "erase_selected_by_shape"}
+
+# Calls that wipe the drawing, making the entities recorded before them irrelevant
+RESET_TOOLS = {"clear_all_entities", "erase_all"}
+
+# Calls whose effect survives a reset (the active layer and created layers)
+STATE_TOOLS = {"set_layer"}
+
+# Written when a server run starts; group names restart with each run
+SESSION_START = "__session_start__"
+
+# Runs of these calls on the same named group are replayed through the bulk path
+BATCHABLE_TOOLS = {"draw_line_simple", "draw_rectangle_simple", "draw_dimension_linear"}
+BATCH_TOOL = "draw_batch"
+
+# Result keys holding the name of a group created by the call
+_GROUP_RESULT_KEYS = ("group_name", "new_group")
+# Argument keys that refer to a group by name
+_GROUP_ARG_KEYS = ("group_name", "new_group_name")
+
+_HEADER = struct.Struct(">I")
+
+
+class SessionRecorder:
+    """Append-only binary log of tool calls.
+
+    Each record is a 4-byte big-endian length followed by a msgpack map:
+    {"t": wall-clock start, "tool": name, "args": kwargs, "dur": seconds, "ok": bool,
+    "groups": group names the call returned, "id": call number}. A session-start record is
+    written first, so several runs can share one file.
+
+    Each call is written twice: a pending record (ok=None) before it runs and a completion
+    record after it returns or raises. Records are flushed as they are written, so a call
+    that was running when the process died is still in the log."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        self._lock = threading.Lock()
+        self._call_ids = itertools.count(1)
+        self.record(SESSION_START, {"pid": os.getpid()}, time.time(), 0.0, True)
+
+    def record(self, tool: str, args: Dict[str, Any], started: float, duration: float,
+               ok: Optional[bool], groups: Optional[Dict[str, str]] = None,
+               call_id: Optional[int] = None, error: Optional[str] = None) -> None:
+        entry = {
+            "t": started,
+            "tool": tool,
+            "args": args,
+            "dur": duration,
+            "ok": ok,
+            "groups": groups or {},
+        }
+        if call_id is not None:
+            entry["id"] = call_id
+        if error is not None:
+            entry["error"] = error
+        payload = msgpack.packb(entry, default=str)
+        with self._lock:
+            self._file.write(_HEADER.pack(len(payload)) + payload)
+            self._file.flush()
+
+    def wrap(self, func: Callable) -> Callable:
+        """Wrap a tool so each call is recorded; read-only tools are returned unchanged"""
+        if func.__name__ in READ_ONLY_TOOLS:
+            return func
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def recorded(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = dict(bound.arguments)
+            call_id = next(self._call_ids)
+            started = time.time()
+            self.record(func.__name__, call_args, started, 0.0, None, call_id=call_id)
+            t0 = time.perf_counter()
+            result = None
+            ok = False
+            error = None
+            try:
+                result = func(*args, **kwargs)
+                ok = not isinstance(result, dict) or result.get("success", True)
+                return result
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                self.record(func.__name__, call_args, started, time.perf_counter() - t0,
+                            bool(ok), _result_groups(result), call_id=call_id, error=error)
+
+        return recorded
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def _result_groups(result: Any) -> Dict[str, str]:
+    """Group names a tool call returned, keyed by where they appear in the result"""
+    if isinstance(result, str):
+        return {"return": result}
+    if isinstance(result, dict):
+        return {key: result[key] for key in _GROUP_RESULT_KEYS if isinstance(result.get(key), str)}
+    return {}
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield records from a session log, stopping at a truncated trailing record"""
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            (length,) = _HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            yield msgpack.unpackb(payload, raw=False)
+
+
+def resolve_pending(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop pending records whose call completed. A pending record without a completion
+    is a call that was running when the process died; it is kept with ok=None."""
+    session = 0
+    completed = set()
+    for rec in records:
+        if rec["tool"] == SESSION_START:
+            session += 1
+        elif rec.get("ok") is not None and "id" in rec:
+            completed.add((session, rec["id"]))
+    resolved = []
+    session = 0
+    for rec in records:
+        if rec["tool"] == SESSION_START:
+            session += 1
+        elif rec.get("ok") is None and (session, rec.get("id")) in completed:
+            continue
+        resolved.append(rec)
+    return resolved
+
+
+def collapse_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce a recorded session to the minimal equivalent call sequence.
+
+    - calls before the last clear_all_entities/erase_all are dropped, except set_layer
+      calls: the first call per layer (which creates it) and the last one (the active layer)
+    - consecutive move_group calls on the same group are merged into one move
+    - consecutive move_all calls are merged into one move
+    - consecutive draw_line_simple/draw_rectangle_simple/draw_dimension_linear calls on
+      the same named group are merged into one draw_batch call"""
+    last_reset = None
+    for i, rec in enumerate(records):
+        if rec["tool"] in RESET_TOOLS:
+            last_reset = i
+    if last_reset is not None:
+        state = [rec for rec in records[:last_reset] if rec["tool"] in STATE_TOOLS]
+        kept = []
+        seen_layers = set()
+        for rec in state:
+            layer = rec["args"].get("layer_name")
+            if layer not in seen_layers:
+                seen_layers.add(layer)
+                kept.append(rec)
+        if state and state[-1] is not kept[-1]:
+            kept.append(state[-1])
+        records = kept + records[last_reset:]
+
+    collapsed: List[Dict[str, Any]] = []
+    for rec in records:
+        prev = collapsed[-1] if collapsed else None
+        if prev is not None and prev["tool"] == rec["tool"] and (
+            (rec["tool"] == "move_group" and prev["args"]["group_name"] == rec["args"]["group_name"])
+            or rec["tool"] == "move_all"
+        ):
+            merged = dict(prev, args=dict(prev["args"]))
+            merged["args"]["dx"] += rec["args"]["dx"]
+            merged["args"]["dy"] += rec["args"]["dy"]
+            merged["dur"] = prev.get("dur", 0) + rec.get("dur", 0)
+            collapsed[-1] = merged
+            continue
+        group = rec["args"].get("group_name")
+        if rec["tool"] in BATCHABLE_TOOLS and group and prev is not None and (
+            prev["tool"] in BATCHABLE_TOOLS or prev["tool"] == BATCH_TOOL
+        ) and prev["args"].get("group_name") == group:
+            if prev["tool"] != BATCH_TOOL:
+                prev = {
+                    "t": prev["t"],
+                    "tool": BATCH_TOOL,
+                    "args": {"group_name": group,
+                             "calls": [{"tool": prev["tool"], "args": prev["args"]}]},
+                    "dur": prev.get("dur", 0),
+                    "ok": True,
+                    "groups": {"group_name": group},
+                }
+            prev["args"]["calls"].append({"tool": rec["tool"], "args": rec["args"]})
+            prev["dur"] += rec.get("dur", 0)
+            collapsed[-1] = prev
+            continue
+        collapsed.append(rec)
+    return collapsed
+
+
+def _call(func: Callable, args: Dict[str, Any]) -> Any:
+    try:
+        return func(**args)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def replay(path: str, tools: Optional[Dict[str, Callable]] = None, collapse: bool = True,
+           paced: bool = False, speed: float = 1.0, skip_failed: bool = True) -> dict:
+    """Re-execute a session log against a set of tools.
+
+    tools maps tool names to callables and defaults to autocad_tools. With paced=False
+    calls run back to back; with paced=True the recorded gaps between calls are kept
+    (divided by speed), which turns a recorded session into a realistic load test.
+    Pacing restarts at each session start and clear, so idle time between server runs
+    is not replayed.
+
+    Group names generated during recording are mapped to the names the target returns,
+    so later calls address the right groups even if IDs are allocated differently.
+    draw_batch records are expanded back into single calls if tools has no draw_batch
+    or the batch fails. Calls that were still running when the recording process died
+    are replayed."""
+    if tools is None:
+        import autocad_tools
+        tools = {func.__name__: func for func in autocad_tools.tools}
+        tools[BATCH_TOOL] = autocad_tools.draw_batch
+
+    records = resolve_pending(list(read_records(path)))
+    if skip_failed:
+        records = [rec for rec in records if rec.get("ok") is not False]
+    recorded_count = sum(1 for rec in records if rec["tool"] != SESSION_START)
+    if collapse:
+        records = collapse_records(records)
+
+    executed = 0
+    batch_fallbacks = 0
+    failures = []
+    missing = set()
+    names: Dict[str, str] = {}
+    t0 = time.perf_counter()
+    base_t = records[0]["t"] if records else 0.0
+    base_clock = t0
+
+    def run(call: Dict[str, Any], report: bool = True) -> bool:
+        nonlocal executed
+        func = tools.get(call["tool"])
+        if func is None:
+            missing.add(call["tool"])
+            return False
+        args = dict(call["args"])
+        for key in _GROUP_ARG_KEYS:
+            if args.get(key) in names:
+                args[key] = names[args[key]]
+        result = _call(func, args)
+        executed += 1
+        if isinstance(result, dict) and not result.get("success", True):
+            if report:
+                failures.append({"tool": call["tool"], "args": args, "result": result})
+            return False
+        actual = _result_groups(result)
+        for key, recorded_name in call.get("groups", {}).items():
+            if key in actual:
+                names[recorded_name] = actual[key]
+        return True
+
+    for rec in records:
+        if rec["tool"] == SESSION_START:
+            # A new server run restarts group IDs; earlier names no longer apply
+            names = {}
+        if rec["tool"] == SESSION_START or rec["tool"] in RESET_TOOLS:
+            base_t = rec["t"]
+            base_clock = time.perf_counter()
+        if rec["tool"] == SESSION_START:
+            continue
+        if paced:
+            delay = (rec["t"] - base_t) / speed - (time.perf_counter() - base_clock)
+            if delay > 0:
+                time.sleep(delay)
+        if rec["tool"] != BATCH_TOOL:
+            run(rec)
+            continue
+        if BATCH_TOOL in tools:
+            if run(rec, report=False):
+                continue
+            # The batch rolled back; draw its calls one by one so the group still exists
+            batch_fallbacks += 1
+        for call in rec["args"]["calls"]:
+            run(dict(call, groups=rec.get("groups", {})))
+
+    elapsed = time.perf_counter() - t0
+    recorded_time = sum(rec.get("dur", 0) for rec in records)
+    return {
+        "success": not failures and not missing,
+        "recorded_calls": recorded_count,
+        "executed_calls": executed,
+        "batch_fallbacks": batch_fallbacks,
+        "elapsed_s": elapsed,
+        "recorded_tool_time_s": recorded_time,
+        "failures": failures,
+        "missing_tools": sorted(missing),
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage: python session_log.py <session.mcplog> [--paced] [--no-collapse]")
+        sys.exit(1)
+    summary = replay(sys.argv[1], collapse="--no-collapse" not in sys.argv,
+                     paced="--paced" in sys.argv)
+    print(summary)
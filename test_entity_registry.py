@@ -0,0 +1,181 @@
+import random
+import threading
+import time
+
+import autocad_tools
+from conftest import FakeModel
+
+THREADS = 16
+
+
+def _run_threads(target, count=THREADS):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+class SlowEntity:
+    """Entity whose Move takes long enough for concurrent calls to overlap"""
+
+    def __init__(self, spans):
+        self.spans = spans
+
+    def Move(self, p1, p2):
+        start = time.perf_counter()
+        time.sleep(0.05)
+        self.spans.append((start, time.perf_counter()))
+
+
+def _assert_tracked_matches_drawing(drawing):
+    tracked = []
+    for name in autocad_tools.entity_groups.keys():
+        with autocad_tools.entity_groups.read(name) as entities:
+            tracked.extend(entities)
+    assert len(tracked) == len(set(map(id, tracked)))
+    assert set(map(id, tracked)) == set(map(id, drawing.ModelSpace))
+
+
+def _overlaps(spans):
+    (a_start, a_end), (b_start, b_end) = sorted(spans)
+    return b_start < a_end
+
+
+def test_next_group_id_unique_across_threads(drawing):
+    ids = []
+
+    def allocate(_):
+        for _ in range(500):
+            ids.append(autocad_tools.get_next_group_id())
+
+    _run_threads(allocate)
+    assert len(ids) == THREADS * 500
+    assert len(set(ids)) == len(ids)
+
+
+def test_ids_not_reused_after_clear(drawing):
+    first = autocad_tools.draw_line_simple(0, 0, 1, 0)["group_name"]
+    autocad_tools.clear_all_entities()
+    second = autocad_tools.draw_line_simple(0, 0, 1, 0)["group_name"]
+    assert first != second
+    assert autocad_tools.list_groups()["groups"] == [second]
+
+
+def test_list_groups_in_creation_order(drawing):
+    names = [f"g{i}" for i in range(40)]
+    for name in names:
+        autocad_tools.draw_line_simple(0, 0, 1, 0, group_name=name)
+    assert autocad_tools.list_groups()["groups"] == names
+
+
+def test_concurrent_transforms_keep_groups_consistent(drawing):
+    pool = []
+    for i in range(4):
+        pool.append(autocad_tools.draw_rectangle_simple(0, 0, 1, 1, group_name=f"g{i}")["group_name"])
+    results = []
+
+    def churn(index):
+        rng = random.Random(index)
+        for _ in range(100):
+            name = rng.choice(pool)
+            op = rng.randrange(4)
+            if op == 0:
+                result = autocad_tools.copy_group(name, 1, 0)
+                if result["success"]:
+                    pool.append(result["new_group"])
+            elif op == 1:
+                result = autocad_tools.mirror_group(name, 0, 0, 1, 0, keep_original=False)
+                if result["success"]:
+                    pool.append(result["new_group"])
+            elif op == 2:
+                result = autocad_tools.move_group(name, 0, 1)
+            else:
+                result = autocad_tools.delete_group(name)
+            results.append(result)
+
+    _run_threads(churn)
+
+    # Failures may only be "group not found", never an exception
+    assert all("error" not in result for result in results)
+
+    # Every live entity is tracked exactly once and no group holds a deleted entity
+    _assert_tracked_matches_drawing(drawing)
+
+
+def test_writes_to_different_groups_overlap(drawing):
+    spans_a, spans_b = [], []
+    autocad_tools.entity_groups.add("a", SlowEntity(spans_a))
+    autocad_tools.entity_groups.add("b", SlowEntity(spans_b))
+
+    _run_threads(lambda index: autocad_tools.move_group("ab"[index], 1, 0), count=2)
+    assert _overlaps(spans_a + spans_b)
+
+
+def test_writes_to_same_group_are_serialized(drawing):
+    spans = []
+    autocad_tools.entity_groups.add("a", SlowEntity(spans))
+
+    _run_threads(lambda index: autocad_tools.move_group("a", 1, 0), count=2)
+    assert len(spans) == 2
+    assert not _overlaps(spans)
+
+
+def test_clear_waits_for_draw_in_progress(drawing, monkeypatch):
+    add_line = FakeModel.AddLine
+    clear = threading.Thread(target=autocad_tools.clear_all_entities)
+    waited = []
+
+    def add_line_then_clear(self, *args):
+        line = add_line(self, *args)
+        # A clear arriving between AddLine and group registration must wait
+        clear.start()
+        clear.join(0.1)
+        waited.append(clear.is_alive())
+        return line
+
+    monkeypatch.setattr(FakeModel, "AddLine", add_line_then_clear)
+    result = autocad_tools.draw_line_simple(0, 0, 1, 0, group_name="walls")
+    clear.join()
+
+    assert result["success"]
+    assert waited == [True]
+    assert drawing.ModelSpace == []
+    assert autocad_tools.list_groups()["groups"] == []
+    assert autocad_tools.move_group("walls", 1, 0)["success"] is False
+
+
+def test_concurrent_draws_and_clears_keep_groups_consistent(drawing):
+    results = []
+
+    def churn(index):
+        rng = random.Random(index)
+        for _ in range(100):
+            op = rng.randrange(10)
+            if op == 0:
+                results.append(autocad_tools.clear_all_entities())
+            elif op < 4:
+                results.append(autocad_tools.draw_line_simple(0, 0, 1, 0, group_name=f"g{rng.randrange(4)}"))
+            elif op < 6:
+                results.append(autocad_tools.draw_grid(0, 0, 2, 2, 1, 1))
+            elif op < 8:
+                results.append(autocad_tools.copy_group(f"g{rng.randrange(4)}", 1, 0))
+            else:
+                results.append(autocad_tools.mirror_group(f"g{rng.randrange(4)}", 0, 0, 1, 0,
+                                                          keep_original=False))
+
+    _run_threads(churn)
+
+    assert all("error" not in result for result in results)
+    _assert_tracked_matches_drawing(drawing)
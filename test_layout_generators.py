@@ -0,0 +1,87 @@
+import pytest
+
+import autocad_tools
+from autocad_tools import _grid_polylines, _serpentine
+from conftest import FakeModel
+
+
+def test_serpentine_alternates_direction():
+    assert _serpentine([0, 1, 2], 0, 5, vertical=True) == [0, 0, 0, 5, 1, 5, 1, 0, 2, 0, 2, 5]
+    assert _serpentine([0, 1], 0, 5, vertical=False) == [0, 0, 5, 0, 5, 1, 0, 1]
+
+
+def test_grid_polylines_3x2():
+    xs = [0, 1, 2, 3]
+    ys = [0, 1, 2]
+    assert _grid_polylines(xs, ys) == [
+        ([0, 0, 0, 2, 1, 2, 1, 0, 2, 0, 2, 2, 3, 2, 3, 0], False),
+        ([0, 0, 3, 0, 3, 1, 0, 1, 0, 2, 3, 2], False),
+    ]
+
+
+def test_draw_grid_emits_two_polylines_in_one_group(drawing):
+    result = autocad_tools.draw_grid(0, 0, 3, 2, 1, 1)
+    assert result["success"]
+    assert result["lines_count"] == 7
+    assert [entity.kind for entity in drawing.ModelSpace] == ["polyline", "polyline"]
+    assert autocad_tools.list_groups()["groups"] == [result["group_name"]]
+
+
+def test_draw_column_array(drawing):
+    result = autocad_tools.draw_column_array(0, 0, 3, 2, 5, 4, 0.4, 0.6)
+    assert result["success"]
+    assert result["columns_count"] == 6
+    first = drawing.ModelSpace[0].args[0]
+    assert first == [v * autocad_tools.METERS_TO_UNITS
+                     for v in [-0.2, -0.3, 0.2, -0.3, 0.2, 0.3, -0.2, 0.3]]
+
+
+def test_draw_dimension_chain(drawing):
+    result = autocad_tools.draw_dimension_chain([[0, 0], {"x": 2, "y": 0}, [5, 0]], -1)
+    assert result["success"]
+    assert [entity.kind for entity in drawing.ModelSpace] == ["dimension", "dimension"]
+
+
+def test_draw_table_cells(drawing):
+    result = autocad_tools.draw_table(0, 10, ["A|B", ["c", ""]], 2, 0.5)
+    assert result["success"]
+    assert (result["rows"], result["columns"], result["text_count"]) == (2, 2, 3)
+
+
+@pytest.mark.parametrize("call", [
+    lambda: autocad_tools.draw_grid(0, 0, 3, 2, 0, 1),
+    lambda: autocad_tools.draw_grid(0, 0, 3, 2, 1, -1),
+    lambda: autocad_tools.draw_grid(0, 0, 0, 2, 1, 1),
+    lambda: autocad_tools.draw_column_array(0, 0, 3, 2, 5, 5, 0, 0.4),
+    lambda: autocad_tools.draw_column_array(0, 0, 3, 2, 5, 5, 6, 0.4),
+    lambda: autocad_tools.draw_column_array(0, 0, 3, 2, -5, 5, 0.4, 0.4),
+    lambda: autocad_tools.draw_table(0, 0, ["A|B"], 2, 0.5, text_height=0.6),
+    lambda: autocad_tools.draw_table(0, 0, ["A|B"], 0, 0.5),
+    lambda: autocad_tools.draw_table(0, 0, [], 2, 0.5),
+])
+def test_invalid_layouts_rejected(drawing, call):
+    result = call()
+    assert not result["success"]
+    assert drawing.ModelSpace == []
+
+
+@pytest.mark.parametrize("method, call", [
+    ("AddDimAligned", lambda: autocad_tools.draw_dimension_chain([[0, 0], [1, 0], [2, 0], [3, 0], [4, 0]], -1)),
+    ("AddLightWeightPolyline", lambda: autocad_tools.draw_column_array(0, 0, 3, 1, 5, 5, 0.4, 0.4)),
+    ("AddText", lambda: autocad_tools.draw_table(0, 10, ["A|B|C"], 2, 0.5)),
+])
+def test_failed_bulk_draw_leaves_nothing_behind(drawing, monkeypatch, method, call):
+    calls = []
+    add = getattr(FakeModel, method)
+
+    def flaky(self, *args):
+        calls.append(args)
+        if len(calls) == 3:
+            raise RuntimeError("COM call failed")
+        return add(self, *args)
+
+    monkeypatch.setattr(FakeModel, method, flaky)
+    result = call()
+    assert not result["success"]
+    assert drawing.ModelSpace == []
+    assert autocad_tools.list_groups()["groups"] == []
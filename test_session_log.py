@@ -0,0 +1,191 @@
+import pytest
+
+import autocad_tools
+import session_log
+from conftest import FakeModel
+from entity_registry import EntityRegistry
+from session_log import SessionRecorder, collapse_records, read_records, replay
+
+
+def _record(tool, **args):
+    return {"t": 0.0, "tool": tool, "args": args, "dur": 0.0, "ok": True, "groups": {}}
+
+
+def _recorded_tools(tmp_path):
+    recorder = SessionRecorder(str(tmp_path / "session.mcplog"))
+    tools = {func.__name__: recorder.wrap(func) for func in autocad_tools.tools}
+    return recorder, tools
+
+
+def test_records_every_tool_except_read_only(tmp_path, drawing):
+    recorder, tools = _recorded_tools(tmp_path)
+    tools["draw_grid"](0, 0, 2, 2, 1, 1)
+    tools["list_groups"]()
+    tools["zoom_extents"]()
+    recorder.close()
+
+    records = list(read_records(recorder.path))
+    assert [(rec["tool"], rec["ok"]) for rec in records] == [
+        (session_log.SESSION_START, True), ("draw_grid", None), ("draw_grid", True)]
+    assert records[1]["id"] == records[2]["id"]
+    assert records[2]["groups"] == {"group_name": "group_1"}
+
+
+def test_records_tool_that_raises(tmp_path, drawing):
+    recorder = SessionRecorder(str(tmp_path / "session.mcplog"))
+
+    def draw_broken(x: float):
+        raise RuntimeError("AutoCAD went away")
+
+    with pytest.raises(RuntimeError):
+        recorder.wrap(draw_broken)(1)
+    recorder.close()
+
+    completion = list(read_records(recorder.path))[-1]
+    assert completion["ok"] is False
+    assert completion["error"] == "AutoCAD went away"
+    assert completion["args"] == {"x": 1}
+
+
+def test_replays_call_running_when_process_died(tmp_path, drawing):
+    recorder, tools = _recorded_tools(tmp_path)
+    crash_log = tmp_path / "crash.mcplog"
+    draw_line = autocad_tools.draw_line_simple
+
+    def draw_line_simple(x1: float, y1: float, x2: float, y2: float, group_name: str = None):
+        # The process dies here: only what is already on disk survives
+        crash_log.write_bytes(open(recorder.path, "rb").read())
+        return draw_line(x1, y1, x2, y2, group_name)
+
+    recorder.wrap(draw_line_simple)(0, 0, 1, 0, group_name="walls")
+    recorder.close()
+
+    drawing.reset()
+    summary = replay(str(crash_log))
+    assert summary["success"], summary
+    assert summary["executed_calls"] == 1
+    assert [entity.kind for entity in drawing.ModelSpace] == ["line"]
+
+
+def test_collapse_keeps_layer_state_across_reset():
+    records = collapse_records([
+        _record("set_layer", layer_name="walls", color=1),
+        _record("draw_line_simple", x1=0, y1=0, x2=1, y2=0),
+        _record("set_layer", layer_name="doors", color=2),
+        _record("set_layer", layer_name="walls", color=7),
+        _record("clear_all_entities"),
+        _record("draw_line_simple", x1=0, y1=0, x2=1, y2=0),
+    ])
+    assert [(rec["tool"], rec["args"].get("layer_name"), rec["args"].get("color")) for rec in records] == [
+        ("set_layer", "walls", 1),
+        ("set_layer", "doors", 2),
+        ("set_layer", "walls", 7),
+        ("clear_all_entities", None, None),
+        ("draw_line_simple", None, None),
+    ]
+
+
+def test_collapse_merges_moves_and_batches_draws():
+    records = collapse_records([
+        _record("move_group", group_name="a", dx=1, dy=0),
+        _record("move_group", group_name="a", dx=2, dy=3),
+        _record("draw_line_simple", x1=0, y1=0, x2=1, y2=0, group_name="walls"),
+        _record("draw_rectangle_simple", x1=0, y1=0, x2=1, y2=1, group_name="walls"),
+        _record("draw_dimension_linear", x1=0, y1=0, x2=1, y2=0, dim_line_y=-1, group_name="walls"),
+        _record("draw_line_simple", x1=0, y1=0, x2=1, y2=0, group_name=None),
+    ])
+    assert [rec["tool"] for rec in records] == ["move_group", "draw_batch", "draw_line_simple"]
+    assert records[0]["args"] == {"group_name": "a", "dx": 3, "dy": 3}
+    assert len(records[1]["args"]["calls"]) == 3
+
+
+def test_replay_remaps_group_names_across_runs(tmp_path, drawing, monkeypatch):
+    path = str(tmp_path / "session.mcplog")
+    for _ in range(2):
+        # Each server run starts with a fresh registry, so group IDs repeat
+        monkeypatch.setattr(autocad_tools, "entity_groups", EntityRegistry())
+        recorder = SessionRecorder(path)
+        tools = {func.__name__: recorder.wrap(func) for func in autocad_tools.tools}
+        group = tools["draw_circle_simple"](0, 0, 1)["group_name"]
+        tools["move_group"](group, 1, 0)
+        recorder.close()
+
+    drawing.reset()
+    monkeypatch.setattr(autocad_tools, "entity_groups", EntityRegistry())
+    summary = replay(path, collapse=False)
+    assert summary["success"], summary
+    assert summary["executed_calls"] == 4
+    # Both circles moved once, each through its own group
+    assert [len(entity.moves) for entity in drawing.ModelSpace] == [1, 1]
+
+
+def test_replay_draws_batches_in_one_group(tmp_path, drawing):
+    recorder, tools = _recorded_tools(tmp_path)
+    tools["draw_line_simple"](0, 0, 1, 0, group_name="walls")
+    tools["draw_rectangle_simple"](0, 0, 1, 1, group_name="walls")
+    recorder.close()
+
+    drawing.reset()
+    autocad_tools.entity_groups.reset()
+    summary = replay(recorder.path)
+    assert summary["success"], summary
+    assert summary["executed_calls"] == 1
+    assert [entity.kind for entity in drawing.ModelSpace] == ["line"] * 5
+    with autocad_tools.entity_groups.read("walls") as entities:
+        assert len(entities) == 5
+
+
+def test_replay_falls_back_to_single_calls_when_batch_fails(tmp_path, drawing, monkeypatch):
+    recorder, tools = _recorded_tools(tmp_path)
+    tools["draw_line_simple"](0, 0, 1, 0, group_name="walls")
+    tools["draw_dimension_linear"](0, 0, 1, 0, -1, group_name="walls")
+    tools["move_group"]("walls", 1, 0)
+    recorder.close()
+
+    drawing.reset()
+    autocad_tools.entity_groups.reset()
+
+    def broken_batch(calls, group_name):
+        return {"success": False, "error": "COM call failed"}
+
+    tools = {func.__name__: func for func in autocad_tools.tools}
+    tools["draw_batch"] = broken_batch
+    summary = replay(recorder.path, tools=tools)
+    assert summary["success"], summary
+    assert summary["batch_fallbacks"] == 1
+    assert [entity.kind for entity in drawing.ModelSpace] == ["line", "dimension"]
+    assert all(len(entity.moves) == 1 for entity in drawing.ModelSpace)
+
+
+def test_paced_replay_skips_gap_between_sessions(tmp_path, drawing, monkeypatch):
+    path = str(tmp_path / "session.mcplog")
+    # Second run starts a day after the first
+    clock = iter([1000.0, 1001.0, 87400.0, 87402.0])
+    monkeypatch.setattr(session_log.time, "time", lambda: next(clock))
+    for _ in range(2):
+        recorder = SessionRecorder(path)
+        recorder.wrap(autocad_tools.draw_circle_simple)(0, 0, 1)
+        recorder.close()
+
+    sleeps = []
+    monkeypatch.setattr(session_log.time, "sleep", sleeps.append)
+    summary = replay(path, paced=True)
+    assert summary["success"], summary
+    assert summary["executed_calls"] == 2
+    assert len(sleeps) == 2
+    assert 0.9 < sleeps[0] <= 1.0
+    assert 1.9 < sleeps[1] <= 2.0
+
+
+def test_failed_draw_batch_leaves_nothing_behind(drawing, monkeypatch):
+    def broken(self, *args):
+        raise RuntimeError("COM call failed")
+
+    monkeypatch.setattr(FakeModel, "AddDimAligned", broken)
+    result = autocad_tools.draw_batch([
+        {"tool": "draw_rectangle_simple", "args": {"x1": 0, "y1": 0, "x2": 1, "y2": 1}},
+        {"tool": "draw_dimension_linear", "args": {"x1": 0, "y1": 0, "x2": 1, "y2": 0, "dim_line_y": -1}},
+    ], "walls")
+    assert not result["success"]
+    assert drawing.ModelSpace == []
+    assert "walls" not in autocad_tools.entity_groups